@@ -25,6 +25,7 @@ from pathlib import Path
 from threading import Event, Lock, Thread
 from typing import Any
 
+import numpy as np
 from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
 
 # Fix MSMF hardware transform compatibility for Windows before importing cv2
@@ -114,10 +115,13 @@ class OpenCVCamera(Camera):
         self.index_or_path = config.index_or_path
 
         self.fps = config.fps
+        self.capture_fps = config.capture_fps
+        self.frame_skip = config.capture_fps // config.fps if config.capture_fps is not None else 1
         self.color_mode = config.color_mode
         self.warmup_s = config.warmup_s
 
         self.videocapture: cv2.VideoCapture | None = None
+        self.capture_buffer: NDArray[Any] | None = None
         if config.fourcc is not None:
             self.fourcc: cv2.VideoWriter_fourcc = cv2.VideoWriter_fourcc(*config.fourcc)
         else:
@@ -160,9 +164,10 @@ class OpenCVCamera(Camera):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} is already connected.")
 
-        # Use 1 thread for OpenCV operations to avoid potential conflicts or
+        # Default to 1 thread for OpenCV operations to avoid potential conflicts or
         # blocking in multi-threaded applications, especially during data collection.
-        cv2.setNumThreads(1)
+        if self.config.cv2_threads is not None:
+            cv2.setNumThreads(self.config.cv2_threads)
 
         self.videocapture = cv2.VideoCapture(self.index_or_path)
 
@@ -174,6 +179,7 @@ class OpenCVCamera(Camera):
             )
 
         self._configure_capture_settings()
+        self._allocate_capture_buffer()
 
         if warmup:
             start_time = time.time()
@@ -183,6 +189,20 @@ class OpenCVCamera(Camera):
 
         logger.info(f"{self} connected.")
 
+    def _allocate_capture_buffer(self) -> None:
+        """
+        Allocates the persistent buffer that rotated or color converted frames are decoded into.
+
+        Those steps copy the frame out into a new array anyway, so decoding into a reused buffer
+        saves a per-frame allocation (see `read`). No buffer is allocated if the backend reports
+        an empty capture size: reads then fall back to OpenCV allocating the frame, and a size
+        mismatch surfaces as the usual `RuntimeError` instead of a `cv2.error`.
+        """
+        if self.capture_width > 0 and self.capture_height > 0:
+            self.capture_buffer = np.empty((self.capture_height, self.capture_width, 3), dtype=np.uint8)
+        else:
+            self.capture_buffer = None
+
     def _configure_capture_settings(self) -> None:
         """
         Applies the specified FOURCC, FPS, width, and height settings to the connected camera.
@@ -237,11 +257,13 @@ class OpenCVCamera(Camera):
         if self.fps is None:
             raise ValueError(f"{self} FPS is not set")
 
-        success = self.videocapture.set(cv2.CAP_PROP_FPS, float(self.fps))
+        # When decimating, the device runs at `capture_fps` and `read` drops the frames in between
+        target_fps = self.capture_fps if self.capture_fps is not None else self.fps
+        success = self.videocapture.set(cv2.CAP_PROP_FPS, float(target_fps))
         actual_fps = self.videocapture.get(cv2.CAP_PROP_FPS)
         # Use math.isclose for robust float comparison
-        if not success or not math.isclose(self.fps, actual_fps, rel_tol=1e-3):
-            raise RuntimeError(f"{self} failed to set fps={self.fps} ({actual_fps=}).")
+        if not success or not math.isclose(target_fps, actual_fps, rel_tol=1e-3):
+            raise RuntimeError(f"{self} failed to set fps={target_fps} ({actual_fps=}).")
 
 
 
@@ -386,15 +408,29 @@ class OpenCVCamera(Camera):
                           received frame dimensions don't match expectations before rotation.
             ValueError: If an invalid `color_mode` is requested.
         """
-        if not self.is_connected:
+        # `videocapture` is only set while connected (see `connect`/`disconnect`), so checking it
+        # avoids the `isOpened()` call behind `is_connected` on every frame.
+        videocapture = self.videocapture
+        if videocapture is None:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
         start_time = time.perf_counter()
 
-        if self.videocapture is None:
-            raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
+        # Drop the frames captured in between when the device runs faster than `fps`.
+        # `grab` dequeues a frame without decoding it, unlike `read`.
+        for _ in range(self.frame_skip - 1):
+            grabbed = videocapture.grab()
+            if not grabbed:
+                raise RuntimeError(f"{self} read failed (status={grabbed}).")
 
-        ret, frame = self.videocapture.read()
+        requested_color_mode = self.color_mode if color_mode is None else color_mode
+        if self.capture_buffer is not None and (
+            self.rotation is not None or requested_color_mode == ColorMode.RGB
+        ):
+            ret, frame = videocapture.read(self.capture_buffer)
+        else:
+            # No postprocessing copy follows, so let OpenCV decode into a fresh array we can hand out.
+            ret, frame = videocapture.read()
 
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
@@ -441,12 +477,16 @@ class OpenCVCamera(Camera):
             raise RuntimeError(f"{self} frame channels={c} do not match expected 3 channels (RGB/BGR).")
 
         processed_image = image
-        if requested_color_mode == ColorMode.RGB:
+        # `self.rotation` is resolved once in __init__ and is None when no rotation is configured.
+        if self.rotation is not None:
+            # Rotate first, then convert the rotated copy in place, so that only one
+            # full-frame buffer is allocated per frame instead of two.
+            processed_image = cv2.rotate(image, self.rotation)
+            if requested_color_mode == ColorMode.RGB:
+                cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB, dst=processed_image)
+        elif requested_color_mode == ColorMode.RGB:
             processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
-            processed_image = cv2.rotate(processed_image, self.rotation)
-
         return processed_image
 
     def _read_loop(self) -> None:
@@ -463,13 +503,20 @@ class OpenCVCamera(Camera):
         if self.stop_event is None:
             raise RuntimeError(f"{self}: stop_event is not initialized before starting read loop.")
 
-        while not self.stop_event.is_set():
+        # Bind the per-iteration callables once. Holding on to this thread's own stop event
+        # also guarantees the loop exits even if a restart swaps in a new `self.stop_event`.
+        stop_event = self.stop_event
+        read = self.read
+        frame_lock = self.frame_lock
+        notify_new_frame = self.new_frame_event.set
+
+        while not stop_event.is_set():
             try:
-                color_image = self.read()
+                color_image = read()
 
-                with self.frame_lock:
+                with frame_lock:
                     self.latest_frame = color_image
-                self.new_frame_event.set()
+                notify_new_frame()
 
             except DeviceNotConnectedError:
                 break
@@ -520,7 +567,7 @@ class OpenCVCamera(Camera):
             TimeoutError: If no frame becomes available within the specified timeout.
             RuntimeError: If an unexpected error occurs.
         """
-        if not self.is_connected:
+        if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
         if self.thread is None or not self.thread.is_alive():
@@ -562,4 +609,6 @@ class OpenCVCamera(Camera):
             self.videocapture.release()
             self.videocapture = None
 
+        self.capture_buffer = None
+
         logger.info(f"{self} disconnected.")
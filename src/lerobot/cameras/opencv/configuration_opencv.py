@@ -50,11 +50,18 @@ class OpenCVCameraConfig(CameraConfig):
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
         fourcc: FOURCC code for video format (e.g., "MJPG", "YUYV", "I420"). Defaults to None (auto-detect).
+        capture_fps: Frame rate requested from the device, if higher than `fps`. Must be an integer multiple
+                     of `fps`; the frames in between are dropped on read. Defaults to None (capture at `fps`).
+        cv2_threads: Number of threads OpenCV may use for its internal parallel loops, applied on connect.
+                     Defaults to 1. Set to None to keep OpenCV's current setting.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
         - FOURCC codes must be 4-character strings (e.g., "MJPG", "YUYV"). Some common FOUCC codes: https://learn.microsoft.com/en-us/windows/win32/medfound/video-fourccs#fourcc-constants
         - Setting FOURCC can help achieve higher frame rates on some cameras.
+        - `cv2.setNumThreads` is process-wide. With several cameras read concurrently, keep `cv2_threads=1`
+          so their conversions don't oversubscribe the CPU. A single high-resolution camera may benefit from
+          None (OpenCV's default thread pool).
     """
 
     index_or_path: int | Path
@@ -62,6 +69,8 @@ class OpenCVCameraConfig(CameraConfig):
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
     fourcc: str | None = None
+    capture_fps: int | None = None
+    cv2_threads: int | None = 1
 
     def __post_init__(self) -> None:
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -83,3 +92,18 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`fourcc` must be a 4-character string (e.g., 'MJPG', 'YUYV'), but '{self.fourcc}' is provided."
             )
+
+        if self.capture_fps is not None and (
+            self.fps is None
+            or self.fps <= 0
+            or self.capture_fps < self.fps
+            or self.capture_fps % self.fps != 0
+        ):
+            raise ValueError(
+                f"`capture_fps` must be an integer multiple of `fps` and at least `fps`, but capture_fps={self.capture_fps} and fps={self.fps} are provided."
+            )
+
+        if self.cv2_threads is not None and self.cv2_threads < 1:
+            raise ValueError(
+                f"`cv2_threads` must be a positive integer or None, but {self.cv2_threads} is provided."
+            )
@@ -20,11 +20,13 @@
 # ```
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
-from lerobot.cameras.configs import Cv2Rotation
+from lerobot.cameras.configs import ColorMode, Cv2Rotation
 from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
@@ -35,6 +37,59 @@ TEST_IMAGE_SIZES = ["128x128", "160x120", "320x180", "480x270"]
 TEST_IMAGE_PATHS = [TEST_ARTIFACTS_DIR / f"image_{size}.png" for size in TEST_IMAGE_SIZES]
 
 
+def _make_videocapture_mock(width, height, fps):
+    """Mocks a cv2.VideoCapture whose n-th captured frame (1-based) is filled with the value n."""
+    state = {"frame_index": 0, "fps": float(fps)}
+    videocapture = MagicMock(name="VideoCaptureMock", spec=cv2.VideoCapture)
+
+    def _grab():
+        state["frame_index"] += 1
+        return True
+
+    def _read(image=None):
+        state["frame_index"] += 1
+        if image is None:
+            image = np.empty((height, width, 3), dtype=np.uint8)
+        image[...] = state["frame_index"]
+        return True, image
+
+    def _set(prop_id, value):
+        if prop_id == cv2.CAP_PROP_FPS:
+            state["fps"] = value
+        return True
+
+    videocapture.grab = MagicMock(side_effect=_grab)
+    videocapture.read = MagicMock(side_effect=_read)
+    videocapture.set = MagicMock(side_effect=_set)
+    videocapture.get = MagicMock(
+        side_effect=lambda prop_id: state["fps"] if prop_id == cv2.CAP_PROP_FPS else 0.0
+    )
+    return videocapture
+
+
+def _make_camera_with_videocapture_mock(config):
+    """Builds an OpenCVCamera wired to a mocked VideoCapture, as if `connect` had succeeded."""
+    camera = OpenCVCamera(config)
+    camera.videocapture = _make_videocapture_mock(camera.capture_width, camera.capture_height, config.fps)
+    camera.capture_buffer = np.empty((camera.capture_height, camera.capture_width, 3), dtype=np.uint8)
+    return camera
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    """Writes a small MJPG video whose n-th frame is filled with the value 20 * n."""
+    path = tmp_path / "video_160x120.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (160, 120))
+    if not writer.isOpened():
+        pytest.skip("OpenCV cannot write MJPG videos in this environment.")
+
+    for i in range(10):
+        writer.write(np.full((120, 160, 3), 20 * i, dtype=np.uint8))
+    writer.release()
+
+    return path
+
+
 def test_abc_implementation():
     """Instantiation should raise an error if the class doesn't implement abstract methods/properties."""
     config = OpenCVCameraConfig(index_or_path=0)
@@ -226,3 +281,107 @@ def test_rotation(rotation, index_or_path):
         assert camera.width == original_width
         assert camera.height == original_height
         assert img.shape[:2] == (original_height, original_width)
+
+
+def test_cv2_threads_configuration(video_path):
+    # `cv2.setNumThreads` is process-wide, so restore it for the tests that follow.
+    original_num_threads = cv2.getNumThreads()
+    config = OpenCVCameraConfig(index_or_path=video_path, cv2_threads=2)
+    camera = OpenCVCamera(config)
+
+    try:
+        camera.connect(warmup=False)
+        assert cv2.getNumThreads() == 2
+    finally:
+        if camera.is_connected:
+            camera.disconnect()
+        cv2.setNumThreads(original_num_threads)
+
+    with pytest.raises(ValueError):
+        OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH, cv2_threads=0)
+
+
+def test_capture_fps_configuration():
+    config = OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH, fps=30, capture_fps=60)
+    camera = OpenCVCamera(config)
+    assert camera.frame_skip == 2
+
+    invalid_settings = [
+        {"fps": 30, "capture_fps": 45},
+        {"fps": None, "capture_fps": 60},
+        {"fps": 30, "capture_fps": 0},
+        {"fps": 30, "capture_fps": -30},
+    ]
+
+    for settings in invalid_settings:
+        with pytest.raises(ValueError):
+            OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH, **settings)
+
+
+@pytest.mark.parametrize("color_mode", [ColorMode.RGB, ColorMode.BGR], ids=["rgb", "bgr"])
+@pytest.mark.parametrize(
+    "rotation", [Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90], ids=["no_rot", "rot90"]
+)
+def test_read_does_not_alias_capture_buffer(video_path, rotation, color_mode):
+    config = OpenCVCameraConfig(index_or_path=video_path, rotation=rotation, color_mode=color_mode)
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+
+    try:
+        first = camera.read()
+        second = camera.read()
+
+        assert not np.shares_memory(first, second)
+        assert not np.shares_memory(first, camera.capture_buffer)
+        assert not np.shares_memory(second, camera.capture_buffer)
+    finally:
+        camera.disconnect()
+
+
+@pytest.mark.parametrize(
+    "rotation", [Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90], ids=["no_rot", "rot90"]
+)
+def test_read_with_empty_reported_size_raises_runtime_error(rotation):
+    config = OpenCVCameraConfig(index_or_path=0, fps=30, rotation=rotation, color_mode=ColorMode.RGB)
+    camera = OpenCVCamera(config)
+    # The mock reports 0x0 for CAP_PROP_FRAME_WIDTH/HEIGHT but delivers 160x120 frames.
+    camera.videocapture = _make_videocapture_mock(160, 120, 30)
+    camera._configure_capture_settings()
+    camera._allocate_capture_buffer()
+
+    assert camera.capture_buffer is None
+
+    with pytest.raises(RuntimeError, match="do not match configured"):
+        camera.read()
+
+
+def test_capture_fps_decimation():
+    config = OpenCVCameraConfig(
+        index_or_path=0, fps=10, capture_fps=30, width=160, height=120, color_mode=ColorMode.BGR
+    )
+    camera = _make_camera_with_videocapture_mock(config)
+
+    camera._validate_fps()
+    camera.videocapture.set.assert_called_once_with(cv2.CAP_PROP_FPS, 30.0)
+
+    frames = [camera.read() for _ in range(3)]
+
+    # Only every third captured frame (1-based: 3, 6, 9) is returned.
+    assert [int(frame[0, 0, 0]) for frame in frames] == [3, 6, 9]
+
+
+def test_capture_fps_grabs_dropped_frames():
+    config = OpenCVCameraConfig(index_or_path=0, fps=15, capture_fps=60, width=160, height=120)
+    camera = _make_camera_with_videocapture_mock(config)
+
+    camera.read()
+
+    # Dropped frames are only grabbed (never decoded), the emitted one is read.
+    assert camera.videocapture.grab.call_count == camera.frame_skip - 1 == 3
+    assert camera.videocapture.read.call_count == 1
+
+    camera.videocapture.grab.side_effect = None
+    camera.videocapture.grab.return_value = False
+
+    with pytest.raises(RuntimeError):
+        camera.read()